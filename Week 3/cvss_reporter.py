@@ -2,6 +2,22 @@
 # cvss_reporter.py
 # Reports vulnerability severity based on CVSS scores
 
+# Severity bands as (lowest score, severity, priority, indicator), highest first
+_SEVERITY_TABLE = (
+    (9.0, "CRITICAL", "P1 - Immediate Action Required", "🔴"),
+    (7.0, "HIGH", "P2 - Urgent Remediation", "🟠"),
+    (4.0, "MEDIUM", "P3 - Schedule Fix", "🟡"),
+    (0.1, "LOW", "P4 - Monitor", "🟢"),
+    (0.0, "NONE", "P5 - Informational", "⚪"),
+)
+
+# One entry per tenth of a point (0.0 - 10.0), built once at import time
+_SEVERITY_LUT = tuple(
+    next(row[1:] for row in _SEVERITY_TABLE if tenths >= round(row[0] * 10))
+    for tenths in range(101)
+)
+
+
 def categorize_cvss(cvss_score, vulnerability_name):
     """
     Categorizes CVSS score and generates a vulnerability report.
@@ -22,27 +38,15 @@ def categorize_cvss(cvss_score, vulnerability_name):
     # Convert score to percentage
     score_percentage = (cvss_score / 10.0) * 100
 
-    # Determine severity category using comparison operators
-    if cvss_score >= 9.0:
-        severity = "CRITICAL"
-        priority = "P1 - Immediate Action Required"
-        color_indicator = "🔴"
-    elif cvss_score >= 7.0:
-        severity = "HIGH"
-        priority = "P2 - Urgent Remediation"
-        color_indicator = "🟠"
-    elif cvss_score >= 4.0:
-        severity = "MEDIUM"
-        priority = "P3 - Schedule Fix"
-        color_indicator = "🟡"
+    # Look up severity category in the precomputed table; any score above
+    # 0.0 is at least LOW, even one that truncates to 0 tenths (e.g. 0.05)
+    if cvss_score >= 10.0:
+        tenths = 100
     elif cvss_score > 0.0:
-        severity = "LOW"
-        priority = "P4 - Monitor"
-        color_indicator = "🟢"
+        tenths = int(cvss_score * 10) or 1
     else:
-        severity = "NONE"
-        priority = "P5 - Informational"
-        color_indicator = "⚪"
+        tenths = 0
+    severity, priority, color_indicator = _SEVERITY_LUT[tenths]
 
     return {
         'vulnerability': vulnerability_name,
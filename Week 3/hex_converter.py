@@ -11,13 +11,20 @@ def hex_to_decimal(hex_value):
 
     Returns: Decimal integer
     """
-    # Remove '0x' prefix if present
-    if hex_value.startswith('0x') or hex_value.startswith('0X'):
-        hex_value = hex_value[2:]
+    # Convert using base 16 (int() already accepts a '0x' prefix)
+    return int(hex_value, 16)
 
-    # Convert using base 16
-    decimal_value = int(hex_value, 16)
-    return decimal_value
+
+def hex_batch_to_decimal(hex_values):
+    """
+    Converts many hexadecimal strings to decimal integers.
+
+    Parameters:
+    - hex_values: Iterable of hex strings (e.g., ["7FFE", "0xBEEF"])
+
+    Returns: List of decimal integers in the same order
+    """
+    return [int(hex_value, 16) for hex_value in hex_values]
 
 
 def decimal_to_hex(decimal_value):
@@ -60,8 +67,7 @@ print("-" * 70)
 memory_addresses = ["7FFE", "BEEF", "DEAD", "C0DE"]
 print("Converting memory addresses to decimal:")
 
-for addr in memory_addresses:
-    decimal = hex_to_decimal(addr)
+for addr, decimal in zip(memory_addresses, hex_batch_to_decimal(memory_addresses)):
     binary = bin(decimal)[2:].zfill(16)  # Show binary too
     print(f"0x{addr}  =  {decimal:>5} decimal  =  {binary} binary")
 
@@ -2,6 +2,44 @@
 # subnet_calculator.py
 # Calculates network information for IPv4 subnets
 
+import socket
+import struct
+
+# Network class for every possible first octet, built once at import time
+_CLASS_BY_OCTET = ["Unknown"] * 256
+for _octet in range(1, 128):
+    _CLASS_BY_OCTET[_octet] = "A"
+for _octet in range(128, 192):
+    _CLASS_BY_OCTET[_octet] = "B"
+for _octet in range(192, 224):
+    _CLASS_BY_OCTET[_octet] = "C"
+_CLASS_BY_OCTET = tuple(_CLASS_BY_OCTET)
+
+
+def mask_long(subnet_mask):
+    """
+    Converts a CIDR prefix length to a 32-bit netmask integer.
+
+    Parameters:
+    - subnet_mask: CIDR notation (e.g., 24 for /24)
+
+    Returns: Netmask as an integer (e.g., 0xFFFFFF00 for /24)
+    """
+    if not 0 <= subnet_mask <= 32:
+        raise ValueError(f"Subnet mask must be between 0 and 32, got {subnet_mask}")
+
+    # Shifting by 32 would leave a 64-bit value, so /0 is special-cased;
+    # the & 0xFFFFFFFF keeps Python's unbounded ints to 32 bits
+    if subnet_mask == 0:
+        return 0
+    return (0xFFFFFFFF << (32 - subnet_mask)) & 0xFFFFFFFF
+
+
+def long_to_ip(value):
+    """Converts a 32-bit integer to dotted-decimal notation."""
+    return socket.inet_ntoa(struct.pack('!I', value))
+
+
 def calculate_subnet(network_ip, subnet_mask):
     """
     Calculates subnet information based on CIDR notation.
@@ -12,31 +50,50 @@ def calculate_subnet(network_ip, subnet_mask):
 
     Returns: Dictionary with subnet information
     """
-    # Calculate total IP addresses using exponent operator
+    # mask_long rejects prefixes outside 0-32, so the shift below never
+    # sees a negative count
+    mask_int = mask_long(subnet_mask)
+
+    # Calculate total IP addresses with a bit shift
     # Formula: 2^(32 - subnet_mask)
-    total_ips = 2 ** (32 - subnet_mask)
+    total_ips = 1 << (32 - subnet_mask)
 
     # Usable hosts = total IPs - 2 (network and broadcast addresses)
     usable_hosts = total_ips - 2
 
     # Determine network class based on first octet
-    first_octet = int(network_ip.split('.')[0])
-
-    if 1 <= first_octet <= 127:
-        network_class = "A"
-    elif 128 <= first_octet <= 191:
-        network_class = "B"
-    elif 192 <= first_octet <= 223:
-        network_class = "C"
+    first_octet = int(network_ip.partition('.')[0])
+
+    if 0 <= first_octet <= 255:
+        network_class = _CLASS_BY_OCTET[first_octet]
     else:
         network_class = "Unknown"
 
+    # Netmask, wildcard and broadcast using 32-bit arithmetic (no per-octet loop)
+    wildcard_int = ~mask_int & 0xFFFFFFFF
+
+    # inet_aton also takes short, hex and octal forms ("10.1" is 10.0.0.1),
+    # so only an address that converts back to the same text is used
+    try:
+        packed = socket.inet_aton(network_ip)
+    except OSError:
+        packed = None
+
+    if packed is not None and socket.inet_ntoa(packed) == network_ip:
+        network_int = struct.unpack('!I', packed)[0]
+        broadcast = long_to_ip(network_int | wildcard_int)
+    else:
+        broadcast = "Unknown"
+
     return {
         'network_ip': network_ip,
         'subnet_mask': subnet_mask,
         'total_ips': total_ips,
         'usable_hosts': usable_hosts,
-        'network_class': network_class
+        'network_class': network_class,
+        'netmask': long_to_ip(mask_int),
+        'wildcard': long_to_ip(wildcard_int),
+        'broadcast': broadcast
     }
 
 
@@ -51,6 +108,8 @@ print("-" * 60)
 result1 = calculate_subnet("192.168.1.0", 24)
 print(f"Network Address: {result1['network_ip']}/{result1['subnet_mask']}")
 print(f"Network Class: Class {result1['network_class']}")
+print(f"Netmask: {result1['netmask']}  (wildcard {result1['wildcard']})")
+print(f"Broadcast Address: {result1['broadcast']}")
 print(f"Total IP Addresses: {result1['total_ips']:,}")
 print(f"Usable Host IPs: {result1['usable_hosts']:,}")
 print(f"Calculation: 2^(32-{result1['subnet_mask']}) = 2^{32-result1['subnet_mask']} = {result1['total_ips']}\n")
@@ -61,6 +120,8 @@ print("-" * 60)
 result2 = calculate_subnet("10.0.10.0", 28)
 print(f"Network Address: {result2['network_ip']}/{result2['subnet_mask']}")
 print(f"Network Class: Class {result2['network_class']}")
+print(f"Netmask: {result2['netmask']}  (wildcard {result2['wildcard']})")
+print(f"Broadcast Address: {result2['broadcast']}")
 print(f"Total IP Addresses: {result2['total_ips']}")
 print(f"Usable Host IPs: {result2['usable_hosts']}")
 print(f"Calculation: 2^(32-{result2['subnet_mask']}) = 2^{32-result2['subnet_mask']} = {result2['total_ips']}\n")
@@ -74,24 +135,31 @@ print("=" * 60)
 network = input("\nEnter network IP address (e.g., 172.16.0.0): ")
 mask = int(input("Enter subnet mask (CIDR notation, e.g., 24): "))
 
-# Calculate and display results
-result = calculate_subnet(network, mask)
-
-print("\n" + "=" * 60)
-print("SUBNET CALCULATION RESULTS")
-print("=" * 60)
-print(f"Network Address:    {result['network_ip']}/{result['subnet_mask']}")
-print(f"Network Class:      Class {result['network_class']}")
-print(f"Total IP Addresses: {result['total_ips']:,}")
-print(f"Usable Host IPs:    {result['usable_hosts']:,}")
-print(f"\nFormula: 2^(32-{result['subnet_mask']}) = {result['total_ips']}")
-print("=" * 60)
-
-# Security context
-print("\n💡 Security Note:")
-if result['total_ips'] > 256:
-    print("   Large subnet - consider segmentation for security isolation")
-elif result['total_ips'] <= 16:
-    print("   Small subnet - good for critical infrastructure isolation")
+# Validate mask range
+if 0 <= mask <= 32:
+    # Calculate and display results
+    result = calculate_subnet(network, mask)
+
+    print("\n" + "=" * 60)
+    print("SUBNET CALCULATION RESULTS")
+    print("=" * 60)
+    print(f"Network Address:    {result['network_ip']}/{result['subnet_mask']}")
+    print(f"Network Class:      Class {result['network_class']}")
+    print(f"Netmask:            {result['netmask']}")
+    print(f"Wildcard Mask:      {result['wildcard']}")
+    print(f"Broadcast Address:  {result['broadcast']}")
+    print(f"Total IP Addresses: {result['total_ips']:,}")
+    print(f"Usable Host IPs:    {result['usable_hosts']:,}")
+    print(f"\nFormula: 2^(32-{result['subnet_mask']}) = {result['total_ips']}")
+    print("=" * 60)
+
+    # Security context
+    print("\n💡 Security Note:")
+    if result['total_ips'] > 256:
+        print("   Large subnet - consider segmentation for security isolation")
+    elif result['total_ips'] <= 16:
+        print("   Small subnet - good for critical infrastructure isolation")
+    else:
+        print("   Medium subnet - suitable for departmental segmentation")
 else:
-    print("   Medium subnet - suitable for departmental segmentation")
\ No newline at end of file
+    print("\n❌ Error: Subnet mask must be between 0 and 32")
\ No newline at end of file
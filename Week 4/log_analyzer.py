@@ -4,86 +4,99 @@
 
 import json
 from collections import Counter
+from operator import itemgetter
+
+# orjson is optional; it serializes in native code when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def parse_log_file(filename):
     """
     Parses firewall log file line by line.
+    Streams the file so only one line is held in memory at a time.
 
-    Returns: List of log entry dictionaries
+    Yields: Log entry dictionaries
     """
-    log_entries = []
-
     with open(filename, 'r') as f:
-        lines = f.readlines()
-
-    for line in lines:
-        # Skip empty lines
-        if not line.strip():
-            continue
-
-        # Split line into components
-        # Format: date time action source_ip dest_ip port
-        parts = line.strip().split()
-
-        if len(parts) >= 6:
-            entry = {
-                'date': parts[0],
-                'time': parts[1],
-                'action': parts[2],
-                'source_ip': parts[3],
-                'dest_ip': parts[4],
-                'port': int(parts[5])
-            }
-            log_entries.append(entry)
-
-    return log_entries
+        for line in f:
+            # Split line into components (split() also drops the newline)
+            # Format: date time action source_ip dest_ip port
+            parts = line.split()
+
+            # Skip empty lines
+            if not parts:
+                continue
+
+            if len(parts) >= 6:
+                yield {
+                    'date': parts[0],
+                    'time': parts[1],
+                    'action': parts[2],
+                    'source_ip': parts[3],
+                    'dest_ip': parts[4],
+                    'port': int(parts[5])
+                }
 
 
 def analyze_logs(log_entries):
     """
     Analyzes parsed log entries for security insights.
+    Makes a single pass, so log_entries may be a generator.
 
     Returns: Dictionary with analysis results
     """
     # Count ALLOW vs DENY
+    total_entries = 0
     allow_count = 0
     deny_count = 0
 
     # Track denied source IPs
     denied_ips = set()
 
-    # Track all denied ports for finding most targeted
-    denied_ports = []
+    # Count denied ports as we go for finding most targeted
+    port_counter = Counter()
 
-    # Track timestamps
-    timestamps = []
+    # Track first and last entries for the time range
+    first_entry = last_entry = None
 
     for entry in log_entries:
+        total_entries += 1
+
         # Count actions
         if entry['action'] == 'ALLOW':
             allow_count += 1
         elif entry['action'] == 'DENY':
             deny_count += 1
             denied_ips.add(entry['source_ip'])
-            denied_ports.append(entry['port'])
+            port_counter[entry['port']] += 1
 
-        # Collect timestamps
-        timestamps.append(f"{entry['date']} {entry['time']}")
+        # Remember the first entry and keep overwriting the last one
+        if first_entry is None:
+            first_entry = entry
+        last_entry = entry
 
-    # Find most targeted port using Counter
-    port_counter = Counter(denied_ports)
+    # Find most targeted port
     most_targeted_port = None
     most_targeted_count = 0
 
     if port_counter:
-        most_targeted_port, most_targeted_count = port_counter.most_common(1)[0]
+        # Single pass over the counts; ties keep the first port seen
+        most_targeted_port, most_targeted_count = max(
+            port_counter.items(), key=itemgetter(1)
+        )
 
     # Determine time range
-    first_timestamp = timestamps[0] if timestamps else "N/A"
-    last_timestamp = timestamps[-1] if timestamps else "N/A"
+    if first_entry is not None:
+        first_timestamp = f"{first_entry['date']} {first_entry['time']}"
+        last_timestamp = f"{last_entry['date']} {last_entry['time']}"
+    else:
+        first_timestamp = last_timestamp = "N/A"
 
     return {
-        'total_entries': len(log_entries),
+        'total_entries': total_entries,
         'allow_count': allow_count,
         'deny_count': deny_count,
         'denied_source_ips': sorted(list(denied_ips)),
@@ -104,8 +117,13 @@ def save_json_report(analysis, filename):
     - analysis: Analysis results dictionary
     - filename: Output JSON filename
     """
-    with open(filename, 'w') as f:
-        json.dump(analysis, f, indent=2)
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+    else:
+        # Non-ASCII stays as UTF-8 text, as orjson writes it
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(analysis, f, indent=2, ensure_ascii=False)
 
 
 def display_summary(analysis):
@@ -172,15 +190,11 @@ if __name__ == "__main__":
     print("=" * 70)
     print()
 
-    # Parse log file
+    # Parse and analyze log file in a single streaming pass
     print("📖 Reading firewall.log...")
-    log_entries = parse_log_file('firewall.log')
-    print(f"✓ Parsed {len(log_entries)} log entries")
-    print()
-
-    # Analyze logs
     print("🔍 Analyzing firewall traffic patterns...")
-    analysis = analyze_logs(log_entries)
+    analysis = analyze_logs(parse_log_file('firewall.log'))
+    print(f"✓ Parsed {analysis['total_entries']} log entries")
     print("✓ Analysis complete")
     print()
 
@@ -4,7 +4,7 @@
 
 # Import functions from our custom modules
 from utils import validate_ip, get_timestamp, format_banner
-from port_checker import check_port_status, is_privileged, get_port_info
+from port_checker import find_open_ports, is_privileged, get_port_info
 from report_gen import generate_json_report, generate_text_summary
 
 
@@ -24,24 +24,23 @@ def scan_ports(target_ip, start_port, end_port):
     print()
 
     open_ports = []
-    total_scanned = 0
-
-    for port in range(start_port, end_port + 1):
-        total_scanned += 1
-        status = check_port_status(port)
-
-        if status == "OPEN":
-            port_data = {
-                'port': port,
-                'status': status,
-                'service': get_port_info(port),
-                'privileged': is_privileged(port)
-            }
-            open_ports.append(port_data)
-
-            # Display open port immediately
-            priv_marker = "⚠️" if is_privileged(port) else "✓"
-            print(f"{priv_marker} Port {port:>5}: {status:6} - {get_port_info(port)}")
+    total_scanned = max(0, end_port - start_port + 1)
+
+    for port in find_open_ports(start_port, end_port):
+        service = get_port_info(port)
+        privileged = is_privileged(port)
+
+        port_data = {
+            'port': port,
+            'status': "OPEN",
+            'service': service,
+            'privileged': privileged
+        }
+        open_ports.append(port_data)
+
+        # Display open port immediately
+        priv_marker = "⚠️" if privileged else "✓"
+        print(f"{priv_marker} Port {port:>5}: {'OPEN':6} - {service}")
 
     scan_data = {
         'target_ip': target_ip,
@@ -2,6 +2,15 @@
 # port_checker.py
 # Port status checking functions
 
+import bisect
+
+# Common ports that we'll simulate as open, kept sorted for range lookups
+COMMON_OPEN_PORTS = (22, 80, 443, 3306, 8080)
+
+# Same ports as a set for constant-time membership checks
+_OPEN_PORT_SET = frozenset(COMMON_OPEN_PORTS)
+
+
 def check_port_status(port):
     """
     Simulates checking if a port is open.
@@ -12,15 +21,28 @@ def check_port_status(port):
 
     Returns: "OPEN" or "CLOSED"
     """
-    # Common ports that we'll simulate as open
-    common_open_ports = [22, 80, 443, 3306, 8080]
-
-    if port in common_open_ports:
+    if port in _OPEN_PORT_SET:
         return "OPEN"
     else:
         return "CLOSED"
 
 
+def find_open_ports(start_port, end_port):
+    """
+    Finds every simulated open port within a port range.
+    Bisects the sorted open-port table instead of checking each port.
+
+    Parameters:
+    - start_port: First port in range
+    - end_port: Last port in range
+
+    Returns: List of open port numbers in ascending order
+    """
+    low = bisect.bisect_left(COMMON_OPEN_PORTS, start_port)
+    high = bisect.bisect_right(COMMON_OPEN_PORTS, end_port)
+    return list(COMMON_OPEN_PORTS[low:high])
+
+
 def is_privileged(port):
     """
     Checks if port is in privileged range (0-1023).
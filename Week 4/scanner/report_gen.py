@@ -4,6 +4,17 @@
 
 import json
 
+# orjson is optional; it serializes in native code when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Report separator lines, built once
+SEP = "=" * 70
+DASH = "-" * 70
+
+
 def generate_json_report(scan_data, filename):
     """
     Generates JSON report of scan results.
@@ -12,8 +23,13 @@ def generate_json_report(scan_data, filename):
     - scan_data: Dictionary containing scan results
     - filename: Output filename
     """
-    with open(filename, 'w') as f:
-        json.dump(scan_data, f, indent=2)
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(scan_data, option=orjson.OPT_INDENT_2))
+    else:
+        # Non-ASCII stays as UTF-8 text, as orjson writes it
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(scan_data, f, indent=2, ensure_ascii=False)
 
     print(f"✓ Report saved to {filename}")
 
@@ -29,22 +45,20 @@ def generate_text_summary(scan_data):
     """
     lines = []
 
-    lines.append("\n" + "=" * 70)
-    lines.append("SCAN SUMMARY")
-    lines.append("=" * 70)
+    lines.extend(("", SEP, "SCAN SUMMARY", SEP))
 
-    lines.append(f"\nTarget IP: {scan_data['target_ip']}")
+    lines.append("")
+    lines.append(f"Target IP: {scan_data['target_ip']}")
     lines.append(f"Scan Time: {scan_data['scan_time']}")
     lines.append(f"Port Range: {scan_data['port_range']['start']}-{scan_data['port_range']['end']}")
 
-    lines.append(f"\nTotal Ports Scanned: {scan_data['total_scanned']}")
+    lines.append("")
+    lines.append(f"Total Ports Scanned: {scan_data['total_scanned']}")
     lines.append(f"Open Ports Found: {len(scan_data['open_ports'])}")
     lines.append(f"Closed Ports: {scan_data['total_scanned'] - len(scan_data['open_ports'])}")
 
     if scan_data['open_ports']:
-        lines.append("\n" + "-" * 70)
-        lines.append("OPEN PORTS DETECTED")
-        lines.append("-" * 70)
+        lines.extend(("", DASH, "OPEN PORTS DETECTED", DASH))
 
         for port_info in scan_data['open_ports']:
             port = port_info['port']
@@ -53,6 +67,6 @@ def generate_text_summary(scan_data):
 
             lines.append(f"  Port {port:>5}: {service:20} {privileged}")
 
-    lines.append("\n" + "=" * 70)
+    lines.extend(("", SEP))
 
     return '\n'.join(lines)
\ No newline at end of file
@@ -2,8 +2,13 @@
 # utils.py
 # Utility functions for security scanner
 
+import socket
+import time
 from datetime import datetime
 
+# Last formatted timestamp as [epoch second, text]
+_timestamp_cache = [None, ""]
+
 def validate_ip(ip):
     """
     Validates IPv4 address format.
@@ -14,17 +19,10 @@ def validate_ip(ip):
     Returns: True if valid, False otherwise
     """
     try:
-        parts = ip.split('.')
-        if len(parts) != 4:
-            return False
-
-        for part in parts:
-            num = int(part)
-            if num < 0 or num > 255:
-                return False
-
-        return True
-    except (ValueError, AttributeError):
+        # inet_aton also accepts short forms ("10.1"), hex and octal octets
+        # ("0377"); only a plain dotted quad converts back to the same text
+        return socket.inet_ntoa(socket.inet_aton(ip)) == ip
+    except (OSError, TypeError, ValueError):
         return False
 
 
@@ -34,7 +32,12 @@ def get_timestamp():
 
     Returns: Timestamp string in format "YYYY-MM-DD HH:MM:SS"
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Only reformat when the second changes; repeated calls reuse the text
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+    return _timestamp_cache[1]
 
 
 def format_banner(text):
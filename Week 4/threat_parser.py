@@ -5,6 +5,11 @@
 import json
 from datetime import datetime
 
+# Report separator lines, built once
+SEP = "=" * 70
+DASH = "-" * 70
+
+
 def load_threat_data(filename):
     """
     Loads threat intelligence data from JSON file.
@@ -35,8 +40,9 @@ def analyze_threats(threat_data):
         'LOW': 0
     }
 
-    # Collect all malicious IPs
-    all_ips = []
+    # Collect unique malicious IPs and count every occurrence
+    unique_ips = set()
+    total_ips = 0
 
     # Find active exploits
     active_exploits = []
@@ -49,7 +55,8 @@ def analyze_threats(threat_data):
 
         # Extract IPs
         ips = threat['indicators']['ips']
-        all_ips.extend(ips)
+        unique_ips.update(ips)
+        total_ips += len(ips)
 
         # Check for active exploits
         if threat['active_exploit']:
@@ -66,8 +73,8 @@ def analyze_threats(threat_data):
     return {
         'total_threats': total_threats,
         'severity_counts': severity_counts,
-        'unique_ips': list(set(all_ips)),  # Remove duplicates
-        'total_ips': len(all_ips),
+        'unique_ips': sorted(unique_ips),  # Sorted once for every consumer
+        'total_ips': total_ips,
         'active_exploits': active_exploits,
         'critical_percentage': critical_percentage
     }
@@ -85,18 +92,14 @@ def generate_report(threat_data, analysis, output_file):
     report_lines = []
 
     # Header
-    report_lines.append("=" * 70)
-    report_lines.append("THREAT INTELLIGENCE ANALYSIS REPORT")
-    report_lines.append("=" * 70)
+    report_lines.extend((SEP, "THREAT INTELLIGENCE ANALYSIS REPORT", SEP))
     report_lines.append(f"Feed: {threat_data['feed_name']}")
     report_lines.append(f"Date: {threat_data['date']}")
     report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     report_lines.append("")
 
     # Summary statistics
-    report_lines.append("-" * 70)
-    report_lines.append("SUMMARY STATISTICS")
-    report_lines.append("-" * 70)
+    report_lines.extend((DASH, "SUMMARY STATISTICS", DASH))
     report_lines.append(f"Total Threats: {analysis['total_threats']}")
     report_lines.append(f"Total Malicious IPs: {analysis['total_ips']}")
     report_lines.append(f"Unique IPs: {len(analysis['unique_ips'])}")
@@ -104,36 +107,31 @@ def generate_report(threat_data, analysis, output_file):
     report_lines.append("")
 
     # Severity breakdown
-    report_lines.append("-" * 70)
-    report_lines.append("SEVERITY BREAKDOWN")
-    report_lines.append("-" * 70)
-    for severity, count in analysis['severity_counts'].items():
-        if count > 0:
-            report_lines.append(f"{severity:10}: {count} threats")
-    report_lines.append(f"\nCRITICAL threats: {analysis['critical_percentage']:.1f}%")
+    report_lines.extend((DASH, "SEVERITY BREAKDOWN", DASH))
+    report_lines.extend(
+        f"{severity:10}: {count} threats"
+        for severity, count in analysis['severity_counts'].items()
+        if count > 0
+    )
+    report_lines.append("")
+    report_lines.append(f"CRITICAL threats: {analysis['critical_percentage']:.1f}%")
     report_lines.append("")
 
     # Malicious IPs
-    report_lines.append("-" * 70)
-    report_lines.append("MALICIOUS IP ADDRESSES")
-    report_lines.append("-" * 70)
-    for ip in sorted(analysis['unique_ips']):
-        report_lines.append(f"  - {ip}")
+    report_lines.extend((DASH, "MALICIOUS IP ADDRESSES", DASH))
+    report_lines.extend(f"  - {ip}" for ip in analysis['unique_ips'])
     report_lines.append("")
 
     # Active exploits
-    report_lines.append("-" * 70)
-    report_lines.append("ACTIVE EXPLOITS (IMMEDIATE ATTENTION REQUIRED)")
-    report_lines.append("-" * 70)
+    report_lines.extend((DASH, "ACTIVE EXPLOITS (IMMEDIATE ATTENTION REQUIRED)", DASH))
     for exploit in analysis['active_exploits']:
-        report_lines.append(f"\n{exploit['id']} ({exploit['type'].upper()})")
+        report_lines.append("")
+        report_lines.append(f"{exploit['id']} ({exploit['type'].upper()})")
         report_lines.append(f"  Description: {exploit['description']}")
     report_lines.append("")
 
     # Footer
-    report_lines.append("=" * 70)
-    report_lines.append("END OF REPORT")
-    report_lines.append("=" * 70)
+    report_lines.extend((SEP, "END OF REPORT", SEP))
 
     # Write to file using context manager
     with open(output_file, 'w') as f:
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 
 from pathlib import Path
+from collections.abc import Iterator
+import errno
+import os
 import shutil
 import argparse
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import json
 
@@ -23,36 +27,54 @@ EXTENSION_MAP = {
     "Other": [".scg", ".file", "README", "noextension" ],
 }
 
+REPORT_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for report files
+
+# Renames and copies block in the OS and release the GIL, so moves
+# are spread over a small thread pool
+MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Inverse of EXTENSION_MAP so each file needs a single dict lookup.
+# Keys are lowercased; entries without a leading dot (e.g. "README")
+# match the whole name of files that have no extension.
+_EXT_TO_CATEGORY = {
+    extension.lower(): category
+    for category, extensions in EXTENSION_MAP.items()
+    for extension in extensions
+}
+
 # ==============================
 # Scanner
 # ==============================
 
-def scan_directory(base_path: Path) -> list[Path]:
-    """Recursively scan directory and return all files."""
+def scan_directory(base_path: Path) -> Iterator[tuple[str, str]]:
+    """Recursively scan directory and yield (name, path) for every file."""
     logging.info(f"Scanning directory: {base_path}")
-    return [file for file in base_path.rglob("*") if file.is_file()]
+    pending = [base_path]
+
+    while pending:
+        # DirEntry type checks reuse the directory listing, no extra stat
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.name, entry.path
 
 
 # ==============================
 # Categorizer
 # ==============================
 
-def categorize_files(files: list[Path]) -> dict[str, list[Path]]:
+def categorize_files(files: Iterator[tuple[str, str]]) -> dict[str, list[Path]]:
     """Categorize files by extension."""
     categorized = defaultdict(list)
 
-    for file in files:
-        extension = file.suffix.lower()
-        matched = False
-
-        for category, extensions in EXTENSION_MAP.items():
-            if extension in extensions:
-                categorized[category].append(file)
-                matched = True
-                break
-
-        if not matched:
-            categorized["Other"].append(file)
+    for name, path in files:
+        # ".ext" for names with a dot, the whole name otherwise (e.g. README)
+        _, dot, extension = name.rpartition(".")
+        key = dot + extension if dot else name
+        category = _EXT_TO_CATEGORY.get(key.lower(), "Other")
+        categorized[category].append(Path(path))
 
     return categorized
 
@@ -61,38 +83,117 @@ def categorize_files(files: list[Path]) -> dict[str, list[Path]]:
 # File Mover
 # ==============================
 
-def resolve_duplicate(destination: Path) -> Path:
-    """Avoid overwriting existing files by renaming duplicates."""
+def list_names(folder: str) -> set[str]:
+    """Return the names of everything in a folder using one directory read."""
+    with os.scandir(folder) as entries:
+        return {entry.name for entry in entries}
+
+
+def claim_destination(destination: str) -> bool:
+    """Atomically create an empty placeholder; False if the name is taken."""
+    try:
+        os.close(os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+    except FileExistsError:
+        return False
+    return True
+
+
+def resolve_duplicate(folder: str, name: str, taken: set[str], reserve: bool) -> str:
+    """Avoid overwriting existing files by renaming duplicates.
+
+    `taken` holds the names already present in `folder` and is updated
+    with the chosen name. With `reserve`, the name is also claimed on disk
+    so a concurrent writer cannot take it first. Works on plain strings
+    so no Path objects are created per candidate.
+    """
+    stem, suffix = os.path.splitext(name)
     counter = 1
-    new_destination = destination
+    candidate = name
 
-    while new_destination.exists():
-        new_destination = destination.with_stem(
-            f"{destination.stem}_{counter}"
-        )
-        counter += 1
+    while True:
+        if candidate not in taken:
+            taken.add(candidate)
+            destination = os.path.join(folder, candidate)
+            if not reserve or claim_destination(destination):
+                return destination
 
-    return new_destination
+        candidate = f"{stem}_{counter}{suffix}"
+        counter += 1
 
 
-def move_files(categorized_files: dict[str, list[Path]], base_path: Path, dry_run: bool):
-    """Move files into category folders."""
-    total_moved = 0
+def move_file(source: Path, destination: str):
+    """Move one file, renaming in place unless it must cross filesystems."""
+    try:
+        # os.replace also overwrites the reserved placeholder on Windows
+        os.replace(source, destination)
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
 
-    for category, files in categorized_files.items():
-        category_folder = base_path / category
-        category_folder.mkdir(exist_ok=True)
+        # Rename already failed, so copy (keeping timestamps) and unlink
+        # instead of letting shutil.move retry the rename
+        shutil.copy2(source, destination)
+        os.unlink(source)
 
-        for file in files:
-            destination = category_folder / file.name
-            destination = resolve_duplicate(destination)
 
-            logging.info(f"Moving: {file} → {destination}")
+def move_reserved(source: Path, destination: str):
+    """Move a file onto its reserved name, removing the placeholder on failure."""
+    try:
+        move_file(source, destination)
+    except OSError:
+        try:
+            os.unlink(destination)
+        except FileNotFoundError:
+            pass
+        raise
 
-            if not dry_run:
-                shutil.move(str(file), str(destination))
 
-            total_moved += 1
+def move_files(categorized_files: dict[str, list[Path]], base_path: Path, dry_run: bool):
+    """Move files into category folders."""
+    total_moved = 0
+    log_moves = logging.getLogger().isEnabledFor(logging.INFO)
+
+    # One listing tells which category folders exist, so re-runs make no
+    # mkdir calls for them
+    with os.scandir(base_path) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+
+    with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as pool:
+        for category, files in categorized_files.items():
+            category_folder = os.path.join(base_path, category)
+            if category not in existing:
+                try:
+                    os.mkdir(category_folder)
+                except FileExistsError:
+                    pass  # Created after the listing was taken
+                existing.add(category)
+            taken = list_names(category_folder)
+            futures = []
+            moves = []
+
+            # Names are picked and logged here, in order, so duplicates
+            # resolve the same way every run; only the moves run in parallel
+            for file in files:
+                destination = resolve_duplicate(
+                    category_folder, file.name, taken, reserve=not dry_run
+                )
+
+                if log_moves:
+                    moves.append(f"Moving: {file} → {destination}")
+
+                if not dry_run:
+                    futures.append(pool.submit(move_reserved, file, destination))
+
+            # One log record per category instead of one per file
+            if moves:
+                logging.info("\n".join(moves))
+
+            # Finish this category before the next folder is listed;
+            # result() re-raises the first failed move
+            for future in as_completed(futures):
+                future.result()
+
+            total_moved += len(files)
 
     return total_moved
 
@@ -103,36 +204,41 @@ def move_files(categorized_files: dict[str, list[Path]], base_path: Path, dry_ru
 
 def generate_report(categorized_files: dict[str, list[Path]], total_moved: int):
     """Generate summary report in console, JSON, and TXT formats."""
+    timestamp = str(datetime.now())
+    header = "====== File Organization Report ======\n"
+    footer = "=======================================\n"
+
+    # One pass over the categories feeds all three outputs; each count is
+    # formatted once and the JSON is streamed in json.dumps(indent=4) layout
+    with open("organization_report.json", "w", buffering=REPORT_BUFFER_SIZE) as json_file, \
+            open("organization_report.txt", "w", buffering=REPORT_BUFFER_SIZE) as txt_file:
+        print("\n" + header, end="")
+        txt_file.write(header)
+        json_file.write(
+            f'{{\n    "timestamp": {json.dumps(timestamp)},\n'
+            f'    "total_files_processed": {total_moved},\n'
+            f'    "categories": '
+        )
 
-    summary = {
-        "timestamp": str(datetime.now()),
-        "total_files_processed": total_moved,
-        "categories": {
-            category: len(files)
-            for category, files in categorized_files.items()
-        }
-    }
-
-    # Console Output
-    print("\n====== File Organization Report ======")
-    for category, count in summary["categories"].items():
-        print(f"{category}: {count} files")
-    print(f"\nTotal files processed: {total_moved}")
-    print(f"Completed at: {summary['timestamp']}")
-    print("=======================================\n")
-
-    # JSON Report
-    with open("organization_report.json", "w") as json_file:
-        json.dump(summary, json_file, indent=4)
-
-    # TXT Report
-    with open("organization_report.txt", "w") as txt_file:
-        txt_file.write("====== File Organization Report ======\n")
-        for category, count in summary["categories"].items():
-            txt_file.write(f"{category}: {count} files\n")
-        txt_file.write(f"\nTotal files processed: {total_moved}\n")
-        txt_file.write(f"Completed at: {summary['timestamp']}\n")
-        txt_file.write("=======================================\n")
+        separator = "{\n"
+        for category, files in categorized_files.items():
+            count = len(files)
+            line = f"{category}: {count} files\n"
+            print(line, end="")
+            txt_file.write(line)
+            json_file.write(f"{separator}        {json.dumps(category)}: {count}")
+            separator = ",\n"
+
+        # An empty object is written as {} just like json.dumps does
+        json_file.write("{}\n}" if separator == "{\n" else "\n    }\n}")
+
+        trailer = (
+            f"\nTotal files processed: {total_moved}\n"
+            f"Completed at: {timestamp}\n"
+            f"{footer}"
+        )
+        print(trailer)
+        txt_file.write(trailer)
 
 
 # ==============================
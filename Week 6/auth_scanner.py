@@ -5,10 +5,18 @@ SOC-Ready Log Parser & Brute Force Detector
 """
 
 import os
+import re
 import json
+import mmap
 import logging
 from collections import Counter
-from datetime import datetime
+from datetime import datetime, timezone
+
+# orjson is optional; it serializes in native code when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # -------------------------
 # Automatically Detect Script Directory
@@ -20,6 +28,9 @@ JSON_REPORT = os.path.join(BASE_DIR, "incident_report.json")
 TEXT_REPORT = os.path.join(BASE_DIR, "incident_report.txt")
 
 ALERT_THRESHOLD = 5  # Brute force threshold
+COUNT_BATCH_SIZE = 1 << 16  # Failed logins collected before counting
+REPORT_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for report files
+READ_CHUNK_SIZE = 4 << 20  # 4 MiB reads when the log cannot be mapped
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,47 +41,62 @@ logging.basicConfig(
 # Log Parsing
 # -------------------------
 
-def parse_log_line_safe(line):
-    """Safely parse key=value authentication log lines."""
-    try:
-        line = line.strip()
-        if not line:
-            return None
-
-        parts = line.split()
-
-        if len(parts) < 2:
-            logging.warning(f"Line too short: {line}")
-            return None
-
-        timestamp = parts[0] + " " + parts[1]
-        data = {"timestamp": timestamp}
-
-        for pair in parts[2:]:
-            if "=" not in pair:
-                logging.warning(f"Malformed field skipped: {pair}")
-                continue
-
-            key, value = pair.split("=", 1)
-            data[key] = value
-
-        return data
-
-    except Exception as e:
-        logging.error(f"Failed to parse line: {line}")
-        logging.error(f"Exception: {e}")
-        return None
-
-
-# -------------------------
-# Detection Logic
-# -------------------------
-
-def is_failed_login(data):
-    return (
-        data.get("event") == "LOGIN" and
-        data.get("status") == "FAIL"
-    )
+# Matches one line including its newline; runs over the whole map in C
+LINE_RE = re.compile(rb"[^\n]*\n|[^\n]+")
+
+
+def iter_log_lines(file_path):
+    """Yield each line of the log as bytes, scanning a memory map if possible."""
+    with open(file_path, "rb") as f:
+        try:
+            log_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files cannot be mapped, and Windows may refuse to map a
+            # log that is still being written; read it in large chunks instead
+            yield from iter_chunked_lines(f)
+            return
+
+        try:
+            for match in LINE_RE.finditer(log_data):
+                yield match.group()
+        finally:
+            log_data.close()
+
+
+def iter_chunked_lines(f):
+    """Yield each line of an open binary file, reading it in large chunks."""
+    # Splitting a whole chunk in C costs far less than a read per line;
+    # the unfinished last line is carried over to the next chunk
+    tail = b""
+    while True:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+
+    if tail:
+        yield tail
+
+
+def count_batch(counter, keys, hot_keys):
+    """Add a batch of keys to counter, recording keys that reach ALERT_THRESHOLD."""
+    # Counter(keys) counts the batch in C; only its unique keys are merged
+    # and checked, so each key is recorded once, in the batch it crosses
+    for key, added in Counter(keys).items():
+        before = counter[key]
+        counter[key] = before + added
+        if before < ALERT_THRESHOLD <= before + added:
+            hot_keys.append(key)
+
+
+def decode_counter(counter):
+    """Convert a Counter with bytes keys to str keys, decoding each key once."""
+    decoded = Counter()
+    for key, count in counter.items():
+        decoded[key.decode(errors="replace")] += count
+    return decoded
 
 
 # -------------------------
@@ -80,6 +106,10 @@ def is_failed_login(data):
 def analyze_log_file(file_path):
     failed_by_user = Counter()
     failed_by_ip = Counter()
+    users = []  # Failed-login keys waiting to be counted in one batch
+    ips = []
+    hot_users = []  # Keys that reached ALERT_THRESHOLD, in the order they did
+    hot_ips = []
     total_failed = 0
     malformed_lines = 0
 
@@ -87,23 +117,59 @@ def analyze_log_file(file_path):
         logging.error(f"Log file not found at: {file_path}")
         return None
 
-    with open(file_path, "r") as f:
-        for line in f:
-            data = parse_log_line_safe(line)
+    # Bound once so the loop does no attribute lookups per line
+    add_user = users.append
+    add_ip = ips.append
 
-            if not data:
-                malformed_lines += 1
-                continue
+    for line in iter_log_lines(file_path):
+        # Date and time come first; everything after is key=value fields
+        parts = line.split(None, 2)
 
-            if is_failed_login(data):
-                total_failed += 1
-                failed_by_user[data.get("user", "UNKNOWN")] += 1
-                failed_by_ip[data.get("ip", "UNKNOWN")] += 1
+        if len(parts) < 2:
+            if parts:
+                logging.warning(f"Line too short: {line.strip().decode(errors='replace')}")
+            malformed_lines += 1
+            continue
+
+        # Skip anything that is not a failed login without parsing its fields;
+        # the plain substring test rejects most lines before any dict is built
+        fields = parts[2] if len(parts) == 3 else b""
+        if b"status=FAIL" not in fields:
+            continue
+
+        # A repeated key keeps its last value, as in the original parser
+        data = {}
+        for pair in fields.split():
+            key, eq, value = pair.partition(b"=")
+            if eq:
+                data[key] = value
+
+        if data.get(b"event") != b"LOGIN" or data.get(b"status") != b"FAIL":
+            continue
+
+        # Keys stay raw bytes and are decoded once at the end
+        add_user(data.get(b"user", b"UNKNOWN"))
+        add_ip(data.get(b"ip", b"UNKNOWN"))
+
+        # Counting whole batches keeps the loop free of Counter updates;
+        # flushing every COUNT_BATCH_SIZE keeps the lists small
+        if len(users) == COUNT_BATCH_SIZE:
+            total_failed += len(users)
+            count_batch(failed_by_user, users, hot_users)
+            count_batch(failed_by_ip, ips, hot_ips)
+            users.clear()
+            ips.clear()
+
+    total_failed += len(users)
+    count_batch(failed_by_user, users, hot_users)
+    count_batch(failed_by_ip, ips, hot_ips)
 
     return {
         "total_failed": total_failed,
-        "failed_by_user": failed_by_user,
-        "failed_by_ip": failed_by_ip,
+        "failed_by_user": decode_counter(failed_by_user),
+        "failed_by_ip": decode_counter(failed_by_ip),
+        "hot_users": [user.decode(errors="replace") for user in hot_users],
+        "hot_ips": [ip.decode(errors="replace") for ip in hot_ips],
         "malformed_lines": malformed_lines
     }
 
@@ -112,65 +178,108 @@ def analyze_log_file(file_path):
 # Brute Force Detection
 # -------------------------
 
-def detect_brute_force(counter, threshold):
-    return {
-        key: count
-        for key, count in counter.items()
-        if count >= threshold
-    }
+def detect_brute_force(counter, hot_keys):
+    """Return counts for the keys that reached the threshold during the scan."""
+    return {key: counter[key] for key in hot_keys}
 
 
 # -------------------------
-# JSON Report (SIEM Ready)
+# Reports (JSON for SIEM, TXT for SOC)
 # -------------------------
 
-def generate_json_report(results):
-    report = {
-        "report_generated_utc": datetime.utcnow().isoformat() + "Z",
-        "log_file": LOG_FILE,
-        "summary": {
-            "total_failed_logins": results["total_failed"],
-            "malformed_lines": results["malformed_lines"]
-        },
-        "failures_by_user": dict(results["failed_by_user"]),
-        "failures_by_ip": dict(results["failed_by_ip"]),
-        "suspected_bruteforce_users": detect_brute_force(
-            results["failed_by_user"], ALERT_THRESHOLD
-        ),
-        "suspected_bruteforce_ips": detect_brute_force(
-            results["failed_by_ip"], ALERT_THRESHOLD
-        )
-    }
+def _stream_json_obj(f, pairs, level=1):
+    """Write (key, count) pairs as an indented JSON object, one pair at a time.
 
-    with open(JSON_REPORT, "w") as f:
-        json.dump(report, f, indent=2)
+    Matches json.dump(..., indent=2, ensure_ascii=False) for a nested object
+    of integers without first copying the pairs into a dict.
+    """
+    pad = "  " * (level + 1)
+    separator = "{\n"
 
-    logging.info(f"JSON report saved to {JSON_REPORT}")
+    for key, count in pairs:
+        f.write(f"{separator}{pad}{json.dumps(key, ensure_ascii=False)}: {count:d}")
+        separator = ",\n"
 
+    # An empty object is written as {} just like json.dump does
+    f.write("{}" if separator == "{\n" else "\n" + "  " * level + "}")
 
-# -------------------------
-# SOC Human-Readable Report
-# -------------------------
 
-def generate_text_report(results):
-    with open(TEXT_REPORT, "w") as f:
-        f.write("=========================================\n")
-        f.write("   AUTHENTICATION FAILURE INCIDENT REPORT\n")
-        f.write("=========================================\n\n")
+def write_json_report(header, sections):
+    """Write the JSON report from (name, value) header fields and (name, pairs) sections.
 
-        f.write(f"Log File Analyzed: {LOG_FILE}\n")
-        f.write(f"Total Failed Logins: {results['total_failed']}\n")
-        f.write(f"Malformed Log Entries: {results['malformed_lines']}\n\n")
-
-        f.write("Top Targeted Users:\n")
-        for user, count in results["failed_by_user"].most_common():
-            f.write(f"  {user}: {count}\n")
+    Both paths write non-ASCII as UTF-8 text, so the file is the same
+    whichever encoder runs.
+    """
+    if orjson is not None:
+        # orjson needs the whole document, but encodes it in native code
+        report = dict(header)
+        report.update((name, dict(pairs)) for name, pairs in sections)
+        with open(JSON_REPORT, "wb", buffering=REPORT_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        return
 
-        f.write("\nTop Attack Source IP Addresses:\n")
-        for ip, count in results["failed_by_ip"].most_common():
-            f.write(f"  {ip}: {count}\n")
+    # Stream the document straight from the pairs instead of building
+    # a report dict with copies of them
+    with open(JSON_REPORT, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+        separator = "{\n"
+        for name, value in header:
+            f.write(f"{separator}  {json.dumps(name)}: {json.dumps(value, ensure_ascii=False)}")
+            separator = ",\n"
+
+        for name, pairs in sections:
+            f.write(f"{separator}  {json.dumps(name)}: ")
+            _stream_json_obj(f, pairs)
+            separator = ",\n"
+
+        f.write("\n}")
+
+
+def generate_reports(results, generated_utc):
+    """Write the JSON and text reports, sharing one ranking of each counter."""
+    # Each counter is sorted once and both reports list keys from most
+    # to least failures
+    by_user = results["failed_by_user"].most_common()
+    by_ip = results["failed_by_ip"].most_common()
+
+    write_json_report(
+        (
+            ("report_generated_utc", generated_utc),
+            ("log_file", LOG_FILE),
+        ),
+        (
+            ("summary", (
+                ("total_failed_logins", results["total_failed"]),
+                ("malformed_lines", results["malformed_lines"]),
+            )),
+            ("failures_by_user", by_user),
+            ("failures_by_ip", by_ip),
+            ("suspected_bruteforce_users", detect_brute_force(
+                results["failed_by_user"], results["hot_users"]
+            ).items()),
+            ("suspected_bruteforce_ips", detect_brute_force(
+                results["failed_by_ip"], results["hot_ips"]
+            ).items()),
+        ),
+    )
+    logging.info(f"JSON report saved to {JSON_REPORT}")
 
-        f.write(f"\nBrute Force Threshold: {ALERT_THRESHOLD}\n")
+    # Build the whole report first, then write it in a single call
+    parts = [
+        "=========================================\n",
+        "   AUTHENTICATION FAILURE INCIDENT REPORT\n",
+        "=========================================\n\n",
+        f"Log File Analyzed: {LOG_FILE}\n",
+        f"Total Failed Logins: {results['total_failed']}\n",
+        f"Malformed Log Entries: {results['malformed_lines']}\n\n",
+        "Top Targeted Users:\n",
+    ]
+    parts.extend(f"  {user}: {count}\n" for user, count in by_user)
+    parts.append("\nTop Attack Source IP Addresses:\n")
+    parts.extend(f"  {ip}: {count}\n" for ip, count in by_ip)
+    parts.append(f"\nBrute Force Threshold: {ALERT_THRESHOLD}\n")
+
+    with open(TEXT_REPORT, "w", buffering=REPORT_BUFFER_SIZE) as f:
+        f.write("".join(parts))
 
     logging.info(f"Text report saved to {TEXT_REPORT}")
 
@@ -180,6 +289,9 @@ def generate_text_report(results):
 # -------------------------
 
 def main():
+    # Captured once and shared by the reports
+    generated_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
     logging.info("Starting authentication log analysis...")
     logging.info(f"Looking for log file at: {LOG_FILE}")
 
@@ -189,8 +301,7 @@ def main():
         logging.error("Analysis stopped due to missing log file.")
         return
 
-    generate_json_report(results)
-    generate_text_report(results)
+    generate_reports(results, generated_utc)
 
     logging.info("Analysis complete.")
 